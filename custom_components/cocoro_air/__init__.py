@@ -1,25 +1,45 @@
 """The Cocoro Air integration."""
+from __future__ import annotations
+
 import logging
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import Any
 
+import httpx
+import orjson
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.util import Throttle
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 DOMAIN = "cocoro_air"
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR, Platform.HUMIDIFIER]
-MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=20)
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass
+class CocoroAirData:
+    """Runtime data stored on a Cocoro Air config entry."""
+
+    cocoro_air_api: CocoroAir
+    coordinator: DataUpdateCoordinator[dict[str, Any]]
+
+
+type CocoroAirConfigEntry = ConfigEntry[CocoroAirData]
+
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: CocoroAirConfigEntry) -> bool:
     """Set up Cocoro Air from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    
     _LOGGER.debug("Setting up entry: %s", entry.as_dict())
     
     try:
@@ -35,25 +55,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Test the connection
         await cocoro_air_api.login()
         
-        hass.data[DOMAIN][entry.entry_id] = {
-            "cocoro_air_api": cocoro_air_api,
-        }
+        # Single fetch site shared by every platform; failures are logged here once
+        coordinator = DataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+            update_method=lambda: _fetch(cocoro_air_api),
+        )
+        await coordinator.async_config_entry_first_refresh()
+
+        entry.runtime_data = CocoroAirData(cocoro_air_api, coordinator)
 
         # Load platforms one at a time to avoid blocking imports
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         return True
         
+    except ConfigEntryNotReady:
+        raise
     except Exception as ex:
         _LOGGER.error("Error setting up entry: %s", ex)
         raise
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: CocoroAirConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
 
-    return unload_ok
+async def _fetch(api):
+    """Poll the API once and parse the sensor data for all entities."""
+    try:
+        raw_data = await api.update()
+        if raw_data is None:
+            raise UpdateFailed("Failed to update sensor data")
+        return api.get_sensor_data(raw_data)
+    except (httpx.HTTPError, KeyError, ValueError) as err:
+        raise UpdateFailed(f"Failed to update sensor data: {err}") from err
 
 
 class CocoroAir:
@@ -81,7 +119,7 @@ class CocoroAir:
         """Login to Cocoro Air."""
         async with self.client as client:
             res = await client.get('https://cocoroplusapp.jp.sharp/v1/cocoro-air/login')
-            redirect_url = res.json()['redirectUrl']
+            redirect_url = orjson.loads(res.content)['redirectUrl']
 
             res = await client.get(redirect_url, follow_redirects=True)
             assert str(res.url).endswith('/sic-front/sso/ExLoginViewAction.do') or str(res.url).startswith('https://cocoroplusapp.jp.sharp/air')
@@ -103,7 +141,6 @@ class CocoroAir:
 
             _LOGGER.info('Login success')
     
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
     async def update(self, retried=False):
         """Call the API."""
         async with self.client as client:
@@ -120,17 +157,18 @@ class CocoroAir:
             if res.status_code == 401 and not retried:
                 _LOGGER.info('Login again')
                 await self.login()
-                return await self.call_get_api(True)
+                return await self.update(True)
             elif res.status_code == 401:
                 _LOGGER.error('Login failed')
                 return None
 
-            _LOGGER.debug(f'cocoro-air response: {res.text}')
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug('cocoro-air response: %s', res.text)
 
             response_data = self.cache
             try:
                 # data = res.json()['objects_aircleaner_020']['body']['data']
-                data = res.json()['sensors_aircleaner_021']['body']['data']
+                data = orjson.loads(res.content)['sensors_aircleaner_021']['body']['data']
                 for item in data:
                     if 'k1' in item:
                         response_data['k1'] = item['k1']
@@ -158,7 +196,7 @@ class CocoroAir:
         dust_level = int(data.get('k2', {}).get('s2'), 16) if data.get('k2', {}).get('s2') else None
         cleanliness_level = int(data.get('k2', {}).get('s4'), 16) if data.get('k2', {}).get('s4') else None
         water_tank = data.get('k2', {}).get('s6') == 'ff' if data.get('k2', {}).get('s6') else None
-        humidity_mode = data.get('k3', {}).get('s7') == 'ff' if data.get('k3', {}).get('s7') else None
+        humidity_mode = data.get('k3', {}).get('s7').lower() == 'ff' if data.get('k3', {}).get('s7') else None
         
 
         parsed = {
@@ -172,7 +210,7 @@ class CocoroAir:
             'water_tank': water_tank,
             'humidity_mode': humidity_mode,
         }
-        _LOGGER.debug(f'Parsed sensor data: {parsed}')
+        _LOGGER.debug('Parsed sensor data: %s', parsed)
         return parsed
 
     async def set_humidity_mode(self, mode, retried=False):
@@ -208,7 +246,8 @@ class CocoroAir:
                 _LOGGER.error(f'Failed to set humidity mode, status code: {res.status_code}, response: {res.text}')
                 return False
 
-            _LOGGER.debug(f'Set humidity mode response: {res.text}')
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug('Set humidity mode response: %s', res.text)
             
             if not self.cache:
                 self.cache = {}
@@ -1,32 +1,27 @@
 """Humidifier platform for Cocoro Air."""
-import logging
-from datetime import timedelta
-
 from homeassistant.components.humidifier import HumidifierEntity, HumidifierDeviceClass
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.util import Throttle
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
+from . import CocoroAirConfigEntry
 
-_LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: CocoroAirConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Cocoro Air Humidifier platform."""
-    cocoro_air_api = hass.data[DOMAIN][config_entry.entry_id]["cocoro_air_api"]
+    cocoro_air_api = config_entry.runtime_data.cocoro_air_api
+    coordinator = config_entry.runtime_data.coordinator
     
     async_add_entities([
-        CocoroAirHumidifier(cocoro_air_api),
+        CocoroAirHumidifier(coordinator, cocoro_air_api),
     ])
 
 
-class CocoroAirHumidifier(HumidifierEntity):
+class CocoroAirHumidifier(CoordinatorEntity, HumidifierEntity):
     """Representation of a Cocoro Air Humidifier."""
 
     _attr_has_entity_name = True
@@ -34,35 +29,29 @@ class CocoroAirHumidifier(HumidifierEntity):
     _attr_icon = "mdi:air-humidifier"
     _attr_device_class = HumidifierDeviceClass.HUMIDIFIER
     
-    def __init__(self, api):
+    def __init__(self, coordinator, api):
         """Initialize the humidifier."""
+        super().__init__(coordinator)
         self._api = api
         self._attr_unique_id = f"{api.device_id}_humidity_mode"
         self._attr_device_info = api.device_info
-        self._attr_is_on = None
+
+    @property
+    def is_on(self):
+        """Return true if the humidity mode is on."""
+        return self.coordinator.data.get('humidity_mode')
 
     @property
     def icon(self):
         """Return the icon to use in the frontend."""
-        return "mdi:air-humidifier-off" if not self._attr_is_on else "mdi:air-humidifier"
+        return "mdi:air-humidifier-off" if not self.is_on else "mdi:air-humidifier"
 
-    async def async_update(self):
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            self._attr_is_on = data['humidity_mode']
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
-    
     async def async_turn_on(self, **kwargs):
         """Turn the humidifier on."""
-        await self._api.set_humidity_mode('on')
-        self._attr_is_on = True
-        self.async_write_ha_state()
+        if await self._api.set_humidity_mode('on'):
+            self.coordinator.async_set_updated_data(self._api.get_sensor_data())
 
     async def async_turn_off(self, **kwargs):
         """Turn the humidifier off."""
-        await self._api.set_humidity_mode('off')
-        self._attr_is_on = False
-        self.async_write_ha_state()
+        if await self._api.set_humidity_mode('off'):
+            self.coordinator.async_set_updated_data(self._api.get_sensor_data())
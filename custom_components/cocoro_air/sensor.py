@@ -1,7 +1,7 @@
 """Sensor platform for Cocoro Air."""
 from __future__ import annotations
 
-import logging
+from typing import Final, NamedTuple
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
 from homeassistant.components.sensor import (
@@ -9,7 +9,6 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
     PERCENTAGE,
@@ -17,86 +16,105 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import CocoroAirConfigEntry
+
+
+class SensorSpec(NamedTuple):
+    """Static description of a Cocoro Air sensor."""
+
+    key: str
+    name: str
+    icon: str
+    device_class: SensorDeviceClass | None = None
+    unit: str | None = None
+    divisor: int | None = None
+
+
+_SENSOR_SPECS: Final[tuple[SensorSpec, ...]] = (
+    SensorSpec(
+        "temperature", "Temperature", "mdi:thermometer",
+        SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS,
+    ),
+    SensorSpec(
+        "humidity", "Humidity", "mdi:water-percent",
+        SensorDeviceClass.HUMIDITY, PERCENTAGE,
+    ),
+    SensorSpec(
+        "pm25", "PM2.5", "mdi:air-filter",
+        SensorDeviceClass.PM25, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    ),
+    SensorSpec("cleaned_air_volume", "Cleaned air volume", "mdi:air-purifier"),
+    SensorSpec("odor_level", "Odor level", "mdi:scent", divisor=33),
+    SensorSpec("dust_level", "Dust level", "mdi:blur", divisor=25),
+    SensorSpec("cleanliness_level", "Cleanliness level", "mdi:air-purifier", divisor=25),
+)
+
+
+def _identity(value):
+    """Return the parsed value unchanged."""
+    return value
+
 
-from . import DOMAIN
+def _scaler(divisor):
+    """Return a function computing round(value / divisor) in integer arithmetic."""
+    double_divisor = 2 * divisor
+
+    def scale(value):
+        if value is None:
+            return None
+        return (value * 2 + divisor) // double_divisor
+
+    return scale
 
-_LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: CocoroAirConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Cocoro Air sensor platform."""
-    cocoro_air_api = hass.data[DOMAIN][entry.entry_id]["cocoro_air_api"]
-
-    entities = [
-        CocoroAirTemperatureSensor(cocoro_air_api),
-        CocoroAirHumiditySensor(cocoro_air_api),
-        CocoroAirWaterTankSensor(cocoro_air_api),
-        CocoroAirPM25Sensor(cocoro_air_api),
-        CocoroAirCleanedAirVolumeSensor(cocoro_air_api),
-        CocoroAirOdorLevelSensor(cocoro_air_api),
-        CocoroAirDustLevelSensor(cocoro_air_api),
-        CocoroAirCleanlinessLevelSensor(cocoro_air_api),
-    ]
-    async_add_entities(entities)
+    cocoro_air_api = entry.runtime_data.cocoro_air_api
+    coordinator = entry.runtime_data.coordinator
 
+    uid_prefix = f"{cocoro_air_api.device_id}_"
+    dev_info = cocoro_air_api.device_info
 
-class CocoroAirTemperatureSensor(SensorEntity):
-    """Representation of a Cocoro Air Temperature Sensor."""
+    async_add_entities([
+        *(
+            CocoroAirSensor(coordinator, spec, uid_prefix, dev_info)
+            for spec in _SENSOR_SPECS
+        ),
+        CocoroAirWaterTankSensor(coordinator, uid_prefix, dev_info),
+    ])
 
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_has_entity_name = True
-    _attr_name = "Temperature"
-    _attr_icon = "mdi:thermometer"
-
-    def __init__(self, api):
-        """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_temperature"
-        self._attr_device_info = api.device_info
-        self._attr_native_value = None
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            self._attr_native_value = data['temperature']
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
+class CocoroAirSensor(CoordinatorEntity, SensorEntity):
+    """Representation of a Cocoro Air Sensor."""
 
-class CocoroAirHumiditySensor(SensorEntity):
-    """Representation of a Cocoro Air Humidity Sensor."""
-
-    _attr_device_class = SensorDeviceClass.HUMIDITY
-    _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_has_entity_name = True
-    _attr_name = "Humidity"
-    _attr_icon = "mdi:water-percent"
 
-    def __init__(self, api):
+    def __init__(self, coordinator, spec, uid_prefix, dev_info):
         """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_humidity"
-        self._attr_device_info = api.device_info
-        self._attr_native_value = None
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            self._attr_native_value = data['humidity']
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
-
-
-class CocoroAirWaterTankSensor(BinarySensorEntity):
+        super().__init__(coordinator)
+        self._key = spec.key
+        self._formatter = _scaler(spec.divisor) if spec.divisor else _identity
+        self._attr_name = spec.name
+        self._attr_icon = spec.icon
+        self._attr_device_class = spec.device_class
+        self._attr_native_unit_of_measurement = spec.unit
+        self._attr_unique_id = uid_prefix + spec.key
+        self._attr_device_info = dev_info
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._formatter(self.coordinator.data.get(self._key))
+
+
+class CocoroAirWaterTankSensor(CoordinatorEntity, BinarySensorEntity):
     """Representation of a Cocoro Air Water Tank Sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.MOISTURE
@@ -104,157 +122,13 @@ class CocoroAirWaterTankSensor(BinarySensorEntity):
     _attr_name = "Water tank"
     _attr_icon = "mdi:water"
 
-    def __init__(self, api):
-        """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_water_tank"
-        self._attr_device_info = api.device_info
-        self._attr_is_on = None
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            self._attr_is_on = data['water_tank']
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
-
-
-class CocoroAirPM25Sensor(SensorEntity):
-    """Representation of a Cocoro Air PM2.5 Sensor."""
-
-    _attr_device_class = SensorDeviceClass.PM25
-    _attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_has_entity_name = True
-    _attr_name = "PM2.5"
-    _attr_icon = "mdi:air-filter"
-
-    def __init__(self, api):
-        """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_pm25"
-        self._attr_device_info = api.device_info
-        self._attr_native_value = None
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            self._attr_native_value = data['pm25']
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
-
-
-class CocoroAirCleanedAirVolumeSensor(SensorEntity):
-    """Representation of a Cocoro Air Cleaned Air Volume Sensor."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_has_entity_name = True
-    _attr_name = "Cleaned air volume"
-    _attr_icon = "mdi:air-purifier"
-
-    def __init__(self, api):
-        """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_cleaned_air_volume"
-        self._attr_device_info = api.device_info
-        self._attr_native_value = None
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            self._attr_native_value = data['cleaned_air_volume']
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
-
-
-class CocoroAirOdorLevelSensor(SensorEntity):
-    """Representation of a Cocoro Air Odor Level Sensor."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_has_entity_name = True
-    _attr_name = "Odor level"
-    _attr_icon = "mdi:scent"
-
-    def __init__(self, api):
-        """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_odor_level"
-        self._attr_device_info = api.device_info
-        self._attr_native_value = None
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            raw_value = data['odor_level']
-            if raw_value is not None:
-                self._attr_native_value = round(raw_value / 33)
-            else:
-                self._attr_native_value = None
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
-
-
-class CocoroAirDustLevelSensor(SensorEntity):
-    """Representation of a Cocoro Air Dust Level Sensor."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_has_entity_name = True
-    _attr_name = "Dust level"
-    _attr_icon = "mdi:blur"
-
-    def __init__(self, api):
-        """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_dust_level"
-        self._attr_device_info = api.device_info
-        self._attr_native_value = None
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            raw_value = data['dust_level']
-            if raw_value is not None:
-                self._attr_native_value = round(raw_value / 25)
-            else:
-                self._attr_native_value = None
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
-
-
-class CocoroAirCleanlinessLevelSensor(SensorEntity):
-    """Representation of a Cocoro Air Cleanliness Level Sensor."""
-
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_has_entity_name = True
-    _attr_name = "Cleanliness level"
-    _attr_icon = "mdi:air-purifier"
-
-    def __init__(self, api):
+    def __init__(self, coordinator, uid_prefix, dev_info):
         """Initialize the sensor."""
-        self._api = api
-        self._attr_unique_id = f"{api.device_id}_cleanliness_level"
-        self._attr_device_info = api.device_info
-        self._attr_native_value = None
-
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            raw_data = await self._api.update()
-            data = self._api.get_sensor_data(raw_data)
-            raw_value = data['cleanliness_level']
-            if raw_value is not None:
-                self._attr_native_value = round(raw_value / 25)
-            else:
-                self._attr_native_value = None
-        except Exception as e:
-            _LOGGER.warning("Failed to update sensor data: %s", e)
+        super().__init__(coordinator)
+        self._attr_unique_id = uid_prefix + "water_tank"
+        self._attr_device_info = dev_info
+
+    @property
+    def is_on(self):
+        """Return the state of the sensor."""
+        return self.coordinator.data.get('water_tank')